@@ -0,0 +1,119 @@
+from array import array
+from bisect import bisect_right
+
+
+class ArrivalIndex:
+    """Arrival-time index shared by the schedulers and metrics.
+
+    Planes are kept in a stable arrival order (ties keep input order) with
+    a calendar of fixed width buckets over arrival_time, so lookups only
+    bisect inside one bucket. The index itself is read-only; each run takes
+    its own cursor from releaser(), whose release() is amortized O(1) per
+    plane, so one index can serve any number of runs.
+    """
+
+    def __init__(self, arrival_times, items=None, ids=None, bucket_width=None, order=None):
+        n = len(arrival_times)
+        if order is None:
+            order = sorted(range(n), key=arrival_times.__getitem__)
+        self.order = array("l", order)
+        self.arrivals = array("l", (arrival_times[i] for i in self.order))
+        self.items = items
+        self.ids = ids
+        self._arrival_by_id = None
+
+        if n:
+            self.start = self.arrivals[0]
+            span = self.arrivals[-1] - self.start + 1
+            # Aim for about one plane per bucket by default
+            self.bucket_width = bucket_width or max(1, span // n)
+            num_buckets = span // self.bucket_width + 1
+        else:
+            self.start = 0
+            self.bucket_width = bucket_width or 1
+            num_buckets = 0
+
+        # bucket_starts[b] is the first position arriving at or after bucket b
+        self.bucket_starts = array("l", [0] * (num_buckets + 1))
+        pos = 0
+        for b in range(num_buckets + 1):
+            bucket_time = self.start + b * self.bucket_width
+            while pos < n and self.arrivals[pos] < bucket_time:
+                pos += 1
+            self.bucket_starts[b] = pos
+
+    @classmethod
+    def from_planes(cls, planes, bucket_width=None):
+        """Index Plane records; queries return planes"""
+        return cls([p.arrival_time for p in planes], items=planes,
+                   ids=[p.id for p in planes], bucket_width=bucket_width)
+
+    @classmethod
+    def from_columns(cls, columns, items=None, bucket_width=None, order=None):
+        """Index the output of read_planes_columns.
+
+        Queries return row numbers, or the matching entries of `items`. A
+        precomputed stable arrival `order` skips the sort.
+        """
+        return cls(columns["arrival_time"], items=items, ids=columns["id"],
+                   bucket_width=bucket_width, order=order)
+
+    def __len__(self):
+        return len(self.arrivals)
+
+    def _bound(self, t):
+        """First position with arrival > t"""
+        b = (t - self.start) // self.bucket_width
+        if b < 0:
+            return 0
+        if b >= len(self.bucket_starts) - 1:
+            return len(self.arrivals)
+        return bisect_right(self.arrivals, t, self.bucket_starts[b], self.bucket_starts[b + 1])
+
+    def _resolve(self, positions):
+        if self.items is None:
+            return [self.order[p] for p in positions]
+        return [self.items[self.order[p]] for p in positions]
+
+    def between(self, t1, t2):
+        """Entries arriving in [t1, t2), O(log n + k) for k results"""
+        return self._resolve(range(self._bound(t1 - 1), self._bound(t2 - 1)))
+
+    def in_arrival_order(self):
+        """All entries sorted by arrival time"""
+        return self._resolve(range(len(self.arrivals)))
+
+    def releaser(self):
+        """A fresh cursor over this index for one scheduling run"""
+        return ArrivalCursor(self)
+
+    def arrival_of(self, plane_id):
+        if self._arrival_by_id is None:
+            self._arrival_by_id = {self.ids[i]: a for i, a in zip(self.order, self.arrivals)}
+        return self._arrival_by_id[plane_id]
+
+
+class ArrivalCursor:
+    """Per-run release state over a shared ArrivalIndex"""
+
+    def __init__(self, index):
+        self.index = index
+        self.position = 0
+
+    def _advance(self, current_time):
+        start, self.position = self.position, max(self.position, self.index._bound(current_time))
+        return range(start, self.position)
+
+    def release(self, current_time):
+        """Entries arriving by current_time that were not released yet"""
+        return self.index._resolve(self._advance(current_time))
+
+    def release_rows(self, current_time):
+        """Like release(), but always as row numbers into the indexed sequence"""
+        return [self.index.order[p] for p in self._advance(current_time)]
+
+    def next_arrival(self):
+        """Arrival time of the next unreleased entry, or None"""
+        if self.position < len(self.index.arrivals):
+            return self.index.arrivals[self.position]
+        return None
@@ -1,29 +1,50 @@
+import heapq
 import time
 import json
 from utils import read_planes_data, log_execution_time
+from models import Slot
+from arrival_index import ArrivalIndex
 
 
-def edf_scheduler(plane_list, progress_callback=None):
-    # Sort planes based on deadline
-    sorted_planes = sorted(plane_list, key=lambda x: x['deadline'])
+def edf_scheduler(plane_list, progress_callback=None, simulate_delay=True, output=None, index=None):
+    if index is None:
+        index = ArrivalIndex.from_planes(plane_list)
+    arrivals = index.releaser()
 
-    runway_schedule = []
+    # Planes that have arrived, earliest deadline first (ties in arrival order)
+    ready = []
+    released = 0
+
+    # Slots go straight into `output` (e.g. a ScheduleColumns) when given
+    runway_schedule = [] if output is None else output
     current_time = 0
+    count = 0
     start = time.time()
 
-    for count, plane in enumerate(sorted_planes, 1):
-        scheduled_at = max(current_time, plane['arrival_time'])
-        runway_schedule.append({
-            "plane_id": plane["id"],
-            "scheduled_at": scheduled_at,
-            "type": plane["type"],
-            "priority": plane["priority"]
-        })
-
-        current_time = scheduled_at + 1
+    while count < len(index):
+        for plane in arrivals.release(current_time):
+            heapq.heappush(ready, (plane.deadline, released, plane))
+            released += 1
+        if not ready:
+            # Nothing waiting, jump straight to the next arrival
+            current_time = arrivals.next_arrival()
+            continue
+
+        _, _, plane = heapq.heappop(ready)
+        runway_schedule.append(Slot(
+            plane_id=plane.id,
+            scheduled_at=current_time,
+            type=plane.type,
+            priority=plane.priority,
+            arrival_time=plane.arrival_time
+        ))
+
+        current_time += 1
+        count += 1
 
         # simulate small delay for UI responsiveness
-        time.sleep(0.001)
+        if simulate_delay:
+            time.sleep(0.001)
 
         if progress_callback:
             elapsed = round((time.time() - start) * 1000, 2)
@@ -35,6 +56,6 @@ def edf_scheduler(plane_list, progress_callback=None):
     return runway_schedule, elapsed_total
 
 
-def run_edf_scheduler(progress_callback=None):
+def run_edf_scheduler(progress_callback=None, output=None):
     planes = read_planes_data("assets/planes.json")
-    return edf_scheduler(planes, progress_callback)
+    return edf_scheduler(planes, progress_callback, output=output)
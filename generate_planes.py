@@ -2,18 +2,25 @@ import json
 import random
 import os
 
-def generate_planes(num_planes=100):
+def make_planes(num_planes=100, seed=None):
+    """Build random plane dicts in memory without touching assets/planes.json"""
+    rng = random.Random(seed)
     planes = []
     for i in range(1, num_planes + 1):
-        arrival = random.randint(1, 300)
+        arrival = rng.randint(1, 300)
         plane = {
             "id": f"PL{1000 + i}",
-            "type": random.choice(["landing", "takeoff"]),
-            "priority": random.randint(1, 3),
+            "type": rng.choice(["landing", "takeoff"]),
+            "priority": rng.randint(1, 3),
             "arrival_time": arrival,
-            "deadline": random.randint(arrival + 10, arrival + 300)
+            "deadline": rng.randint(arrival + 10, arrival + 300)
         }
         planes.append(plane)
+    return planes
+
+
+def generate_planes(num_planes=100):
+    planes = make_planes(num_planes)
 
     os.makedirs("assets", exist_ok=True)
     with open("assets/planes.json", "w") as f:
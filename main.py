@@ -1,18 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
-from scheduler_original import run_and_time_scheduler as run_original
-from scheduler_optimized import run_and_time_scheduler as run_optimized
-from edf_scheduler import run_edf_scheduler
-from round_robin_scheduler import run_rr_scheduler
-from priority_preemptive_scheduler import run_pp_scheduler
+import scheduler_registry
+from scheduler_registry import SCHEDULERS, SCHEDULER_NAMES
 from generate_planes import generate_planes
+from schedule_store import ScheduleColumns
+from schedule_viewer import ScheduleViewer
+from schedule_export import export_schedule
+import metrics
 from theme import styles
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import csv
 import time
 import os
-import inspect
 
 class AirportSchedulerApp:
     def __init__(self, root):
@@ -22,11 +20,8 @@ class AirportSchedulerApp:
         
         # Initialize data structures with smoothing buffers
         self.scheduler_data = {
-            "FCFS": {"x": [], "y": [], "color": "#FF5722", "buffer": []},
-            "Optimized": {"x": [], "y": [], "color": "#4CAF50", "buffer": []},
-            "EDF": {"x": [], "y": [], "color": "#2196F3", "buffer": []},
-            "Round Robin": {"x": [], "y": [], "color": "#9C27B0", "buffer": []},
-            "Priority Preemptive": {"x": [], "y": [], "color": "#FFC107", "buffer": []}
+            name: {"x": [], "y": [], "color": spec.color, "buffer": []}
+            for name, spec in SCHEDULERS.items()
         }
         
         os.makedirs("results", exist_ok=True)
@@ -146,7 +141,7 @@ class AirportSchedulerApp:
                 bg=styles.COLOR_BG,
                 fg=styles.COLOR_TEXT).grid(row=0, column=4, padx=5)
         self.algorithm = ttk.Combobox(control_frame, 
-                                    values=["FCFS", "Optimized", "EDF", "Round Robin", "Priority Preemptive"])
+                                    values=SCHEDULER_NAMES)
         self.algorithm.current(0)
         self.algorithm.grid(row=0, column=5, padx=5)
         
@@ -160,6 +155,9 @@ class AirportSchedulerApp:
         
         # Results Table
         self.init_results_table(scrollable_frame)
+
+        # Schedule Viewer
+        self.init_schedule_viewer(scrollable_frame)
         
         # Status Log
         self.log_output = tk.Text(
@@ -174,6 +172,10 @@ class AirportSchedulerApp:
 
     def init_live_graph(self, parent):
         """Initialize the live progress graph"""
+        # matplotlib is only imported once a graph is shown to keep startup fast
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         plt.style.use('dark_background')
         
         self.fig, self.ax = plt.subplots(figsize=(10, 4), facecolor=styles.COLOR_BG)
@@ -229,6 +231,47 @@ class AirportSchedulerApp:
                   text="Clear All Results", 
                   command=self.clear_results).pack(side=tk.RIGHT, pady=5)
 
+    def init_schedule_viewer(self, parent):
+        """Initialize the per-plane schedule viewer for the last run"""
+        frame = tk.Frame(parent, bg=styles.COLOR_BG)
+        frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+
+        self.schedule_label = tk.Label(frame,
+                text="🛬 Last Schedule",
+                font=("Arial", 12, "bold"),
+                bg=styles.COLOR_BG,
+                fg=styles.COLOR_TEXT)
+        self.schedule_label.pack(anchor="w")
+
+        self.last_schedule = None
+        self.schedule_viewer = ScheduleViewer(frame, visible_rows=15, bg=styles.COLOR_BG)
+        self.schedule_viewer.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Button(frame,
+                  text="Export Schedule",
+                  command=self.export_schedule).pack(side=tk.RIGHT, pady=5)
+
+    def export_schedule(self):
+        """Stream the last schedule to CSV or Parquet"""
+        if self.last_schedule is None:
+            self.log("No schedule to export. Run a scheduler first.")
+            return
+
+        filepath = filedialog.asksaveasfilename(
+            initialdir="results",
+            initialfile="schedule_output.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV File", "*.csv"), ("Parquet File", "*.parquet")],
+            title="Export Schedule"
+        )
+
+        if filepath:
+            try:
+                rows = export_schedule(self.last_schedule, filepath)
+                self.log(f"Exported {rows} rows to {filepath}")
+            except Exception as e:
+                self.log(f"Export failed: {str(e)}")
+
     def log(self, message):
         """Add a message to the log"""
         timestamp = time.strftime("[%H:%M:%S]")
@@ -274,7 +317,11 @@ class AirportSchedulerApp:
         self.graph_lines[algo].set_data([], [])
         self.graph_canvas.draw()
 
-        self.log(f"Running {algo} scheduler with {count} planes and {runways} runways...")
+        spec = SCHEDULERS[algo]
+        capabilities = [name for name, flag in (("preemptive", spec.preemptive),
+                                                ("streaming", spec.streaming)) if flag]
+        self.log(f"Running {algo} scheduler with {count} planes and {runways} runways"
+                 f"{' (' + ', '.join(capabilities) + ')' if capabilities else ''}...")
         generate_planes(count)
 
         def progress_callback(completed, elapsed):
@@ -284,16 +331,16 @@ class AirportSchedulerApp:
             self.root.update()
 
         try:
-            if algo == "FCFS":
-                schedule, time_taken = run_original(num_runways=runways, progress_callback=progress_callback)
-            elif algo == "Optimized":
-                schedule, time_taken = run_optimized(num_runways=runways, progress_callback=progress_callback)
-            elif algo == "EDF":
-                schedule, time_taken = run_edf_scheduler(progress_callback=progress_callback)
-            elif algo == "Round Robin":
-                schedule, time_taken = run_rr_scheduler(progress_callback=progress_callback)
-            elif algo == "Priority Preemptive":
-                schedule, time_taken = run_pp_scheduler(progress_callback=progress_callback)
+            # One arrival index per dataset, shared by the scheduler and the metrics
+            planes, index = scheduler_registry.load_dataset()
+            peak_start, peak_count = metrics.peak_arrivals(index)
+            self.log(f"Busiest arrivals: {peak_count} planes in [{peak_start}, {peak_start + 10})")
+
+            # Slots are appended straight into the array-backed store
+            schedule, time_taken = scheduler_registry.run_scheduler(algo, planes, num_runways=runways,
+                                                                    progress_callback=progress_callback,
+                                                                    output=ScheduleColumns(),
+                                                                    index=index)
 
             # Final update with all points
             self.scheduler_data[algo]["x"].extend([x for x, y in self.scheduler_data[algo]["buffer"]])
@@ -303,7 +350,10 @@ class AirportSchedulerApp:
             self.ax.autoscale_view()
             self.graph_canvas.draw()
             
-            self.add_result(algo, time_taken, schedule)
+            self.add_result(algo, time_taken, schedule, index, per_plane=spec.preemptive)
+            self.last_schedule = schedule
+            self.schedule_viewer.set_schedule(self.last_schedule)
+            self.schedule_label.config(text=f"🛬 Last Schedule ({algo}, {len(self.last_schedule)} slots)")
             self.save_to_csv(algo, time_taken)
             self.log(f"{algo} completed in {time_taken:.2f} ms")
 
@@ -321,27 +371,21 @@ class AirportSchedulerApp:
                 writer.writerow(["timestamp", "algorithm", "time_ms"])
             writer.writerow([time.strftime("%Y-%m-%d %H:%M:%S"), algorithm, time_ms])
 
-    def add_result(self, algorithm, time_ms, schedule):
+    def add_result(self, algorithm, time_ms, schedule, index=None, per_plane=False):
         """Add a result to the comparison table"""
-        avg_delay = self.calculate_avg_delay(schedule)
+        avg_delay = self.calculate_avg_delay(schedule, index, per_plane)
         utilization = self.calculate_utilization(schedule)
         self.results_table.insert("", tk.END, 
                                 values=(algorithm, f"{time_ms:.2f}", 
                                       f"{avg_delay:.2f}", f"{utilization:.1f}%"))
 
-    def calculate_avg_delay(self, schedule):
-        """Calculate average delay from schedule"""
-        if not schedule:
-            return 0
-        delays = [plane["scheduled_at"] - plane.get("arrival_time", 0) for plane in schedule]
-        return sum(delays) / len(delays)
+    def calculate_avg_delay(self, schedule, index=None, per_plane=False):
+        """Calculate average delay from schedule, once per plane for preemptive schedulers"""
+        return metrics.calculate_avg_delay(schedule, index, per_plane)
 
     def calculate_utilization(self, schedule):
         """Calculate runway utilization percentage"""
-        if not schedule:
-            return 0
-        last_time = max(plane["scheduled_at"] for plane in schedule)
-        return (last_time / (last_time + 1)) * 100
+        return metrics.calculate_utilization(schedule)
 
     def clear_results(self):
         """Clear all results from the table and graphs"""
@@ -353,6 +397,9 @@ class AirportSchedulerApp:
             self.scheduler_data[algo]["buffer"] = []
             self.graph_lines[algo].set_data([], [])
         self.graph_canvas.draw()
+        self.last_schedule = None
+        self.schedule_viewer.set_schedule(None)
+        self.schedule_label.config(text="🛬 Last Schedule")
         self.log("Cleared all results")
 
     def get_best_scheduler_times(self):
@@ -367,19 +414,14 @@ class AirportSchedulerApp:
             return {}
 
         best_times = {}
-        schedulers = [
-            ("FCFS", run_original),
-            ("Optimized", run_optimized),
-            ("EDF", run_edf_scheduler),
-            ("Round Robin", run_rr_scheduler),
-            ("Priority Preemptive", run_pp_scheduler)
-        ]
 
-        for algo_name, scheduler_func in schedulers:
+        for algo_name in SCHEDULER_NAMES:
             try:
                 self.log(f"Running {algo_name}...")  # Debug line
                 generate_planes(num_planes)
-                _, exec_time = scheduler_func(num_runways=num_runways) if "runways" in inspect.signature(scheduler_func).parameters else scheduler_func()
+                planes, index = scheduler_registry.load_dataset()
+                _, exec_time = scheduler_registry.run_scheduler(algo_name, planes, num_runways=num_runways,
+                                                                index=index)
                 best_times[algo_name] = exec_time
                 self.log(f"{algo_name} completed in {exec_time:.2f} ms")  # Debug line
             except Exception as e:
@@ -390,6 +432,9 @@ class AirportSchedulerApp:
 
     def show_performance_graph(self):
         """Show real performance comparison using actual scheduler execution times"""
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.clear_content()
         
         # Create loading indicator
@@ -416,7 +461,7 @@ class AirportSchedulerApp:
         # Create the graph
         fig, ax = plt.subplots(figsize=(10, 6), facecolor=styles.COLOR_BG)
         
-        algorithms = ["FCFS", "Optimized", "EDF", "Round Robin", "Priority Preemptive"]
+        algorithms = SCHEDULER_NAMES
         times = [best_times.get(algo, 0) for algo in algorithms]
 
         bars = ax.bar(algorithms, times, 
@@ -0,0 +1,74 @@
+import math
+
+
+def slot_delays(schedule, index=None):
+    """Per-slot delay; with an ArrivalIndex the true arrival time is looked up"""
+    if index is None:
+        return [slot.scheduled_at - slot.arrival_time for slot in schedule]
+    return [slot.scheduled_at - index.arrival_of(slot.plane_id) for slot in schedule]
+
+
+def plane_delays(schedule, index=None):
+    """Per-plane delay: first service start minus arrival.
+
+    Preemptive schedulers emit one slot per slice, so a plane is only
+    counted once, at the start of its first slice.
+    """
+    first_start = {}
+    arrival = {}
+    for slot in schedule:
+        if slot.plane_id not in first_start or slot.scheduled_at < first_start[slot.plane_id]:
+            first_start[slot.plane_id] = slot.scheduled_at
+            arrival[slot.plane_id] = slot.arrival_time
+    if index is None:
+        return [start - arrival[plane_id] for plane_id, start in first_start.items()]
+    return [start - index.arrival_of(plane_id) for plane_id, start in first_start.items()]
+
+
+def _delays(schedule, index, per_plane):
+    return plane_delays(schedule, index) if per_plane else slot_delays(schedule, index)
+
+
+def calculate_avg_delay(schedule, index=None, per_plane=False):
+    """Calculate average delay from schedule"""
+    if not schedule:
+        return 0
+    delays = _delays(schedule, index, per_plane)
+    return sum(delays) / len(delays)
+
+
+def percentile_delay(schedule, pct=95, index=None, per_plane=False):
+    """Nearest-rank percentile of the per-slot (or per-plane) delays"""
+    if not schedule:
+        return 0
+    delays = sorted(_delays(schedule, index, per_plane))
+    rank = max(math.ceil(pct / 100 * len(delays)) - 1, 0)
+    return delays[min(rank, len(delays) - 1)]
+
+
+def makespan(schedule):
+    """Time the last plane leaves the runway"""
+    return max((slot.completed_at if slot.completed_at is not None else slot.scheduled_at + 1
+                for slot in schedule), default=0)
+
+
+def calculate_utilization(schedule):
+    """Calculate runway utilization percentage"""
+    if not schedule:
+        return 0
+    last_time = max(slot.scheduled_at for slot in schedule)
+    return (last_time / (last_time + 1)) * 100
+
+
+def peak_arrivals(index, window=10):
+    """Busiest arrival window as (start, count), for windows [t, t + window)"""
+    peak_start, peak_count = 0, 0
+    previous = None
+    for t in index.arrivals:
+        if t == previous:
+            continue
+        previous = t
+        count = len(index.between(t, t + window))
+        if count > peak_count:
+            peak_start, peak_count = t, count
+    return peak_start, peak_count
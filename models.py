@@ -0,0 +1,55 @@
+import sys
+from dataclasses import dataclass
+
+
+def intern_type(plane_type):
+    """Return the shared string object for a plane type.
+
+    Types repeat across every record, so all planes point at one copy.
+    """
+    return sys.intern(plane_type)
+
+
+@dataclass(frozen=True, slots=True)
+class Plane:
+    id: str
+    type: str
+    priority: int
+    arrival_time: int
+    deadline: int
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            id=data["id"],
+            type=intern_type(data["type"]),
+            priority=int(data["priority"]),
+            arrival_time=int(data["arrival_time"]),
+            deadline=int(data["deadline"]),
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "type": self.type,
+            "priority": self.priority,
+            "arrival_time": self.arrival_time,
+            "deadline": self.deadline,
+        }
+
+
+@dataclass(slots=True)
+class Slot:
+    """One runway allocation produced by a scheduler"""
+    plane_id: str
+    scheduled_at: int
+    type: str
+    priority: int
+    arrival_time: int
+    runway_id: int = 1
+    completed_at: int | None = None
+    runway_used: int | None = None
+
+    @property
+    def runway(self):
+        return f"R{self.runway_id}"
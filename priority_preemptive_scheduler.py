@@ -1,44 +1,54 @@
 import time
+import heapq
 import json
 from utils import read_planes_data, log_execution_time
-
-def priority_preemptive_scheduler(plane_list, progress_callback=None):
-    # Sort initially by arrival time
-    plane_list.sort(key=lambda x: x['arrival_time'])
-    n = len(plane_list)
+from models import Slot
+from arrival_index import ArrivalIndex
+
+def priority_preemptive_scheduler(plane_list, progress_callback=None, index=None, simulate_delay=True,
+                                  output=None):
+    if index is None:
+        index = ArrivalIndex.from_planes(plane_list)
+    arrivals = index.releaser()
+    n = len(index)
     completed = 0
     current_time = 0
-    schedule = []
+    # Slots go straight into `output` (e.g. a ScheduleColumns) when given
+    schedule = [] if output is None else output
     start = time.time()
 
-    # Set remaining times
-    for plane in plane_list:
-        plane['remaining_time'] = 1  # all tasks take 1 unit to complete for simplicity
-        plane['scheduled'] = False
+    # Ready queue of arrived planes: (priority, arrival order, plane)
+    ready = []
+    released = 0
+    remaining_time = 1  # all tasks take 1 unit to complete for simplicity
 
     while completed < n:
-        # Get all arrived and not completed planes
-        available = [p for p in plane_list if p['arrival_time'] <= current_time and not p['scheduled']]
-        if not available:
-            current_time += 1
+        for plane in arrivals.release(current_time):
+            heapq.heappush(ready, (plane.priority, released, plane))
+            released += 1
+
+        if not ready:
+            # Nothing waiting, jump straight to the next arrival
+            current_time = arrivals.next_arrival()
             continue
 
         # Pick highest priority (lowest number = highest priority)
-        current_plane = sorted(available, key=lambda x: x['priority'])[0]
+        _, _, current_plane = heapq.heappop(ready)
 
         scheduled_at = current_time
-        current_time += current_plane['remaining_time']
-        current_plane['scheduled'] = True
+        current_time += remaining_time
         completed += 1
 
-        schedule.append({
-            "plane_id": current_plane["id"],
-            "scheduled_at": scheduled_at,
-            "type": current_plane["type"],
-            "priority": current_plane["priority"]
-        })
+        schedule.append(Slot(
+            plane_id=current_plane.id,
+            scheduled_at=scheduled_at,
+            type=current_plane.type,
+            priority=current_plane.priority,
+            arrival_time=current_plane.arrival_time
+        ))
 
-        time.sleep(0.001)
+        if simulate_delay:
+            time.sleep(0.001)
         if progress_callback:
             elapsed = round((time.time() - start) * 1000, 2)
             progress_callback(completed, elapsed)
@@ -48,6 +58,6 @@ def priority_preemptive_scheduler(plane_list, progress_callback=None):
     log_execution_time("PriorityPreemptive", elapsed_total)
     return schedule, elapsed_total
 
-def run_pp_scheduler(progress_callback=None):
+def run_pp_scheduler(progress_callback=None, output=None):
     planes = read_planes_data("assets/planes.json")
-    return priority_preemptive_scheduler(planes, progress_callback)
+    return priority_preemptive_scheduler(planes, progress_callback, output=output)
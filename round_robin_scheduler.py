@@ -1,60 +1,86 @@
 import json
 import time
+from collections import deque
 from utils import read_planes_data, log_execution_time
+from models import Slot
+from arrival_index import ArrivalIndex
 
-def round_robin_scheduler(plane_list, time_quantum=2, progress_callback=None):
+def _service_time(plane, time_quantum):
+    """Runway time a plane needs: emergency 1, cargo 3, others 2 quanta"""
+    if plane.type.lower() == 'emergency':
+        return time_quantum * 1
+    elif plane.type.lower() == 'cargo':
+        return time_quantum * 3
+    return time_quantum * 2
+
+
+def round_robin_scheduler(plane_list, time_quantum=2, progress_callback=None, index=None, output=None):
     """Round Robin scheduler with accurate progress plotting for completed planes."""
 
-    for plane in plane_list:
-        if plane['type'].lower() == 'emergency':
-            plane['remaining_time'] = time_quantum * 1
-        elif plane['type'].lower() == 'cargo':
-            plane['remaining_time'] = time_quantum * 3
-        else:
-            plane['remaining_time'] = time_quantum * 2
+    if index is None:
+        index = ArrivalIndex.from_planes(plane_list)
+    arrivals = index.releaser()
+
+    # Queue entries are [plane, remaining_time] so the input planes stay untouched
+    queue = deque()
+
+    def admit(current_time):
+        for plane in arrivals.release(current_time):
+            queue.append([plane, _service_time(plane, time_quantum)])
 
-    queue = sorted(plane_list, key=lambda x: x['arrival_time'])
     current_time = 0
-    runway_schedule = []
-    total_planes = len(queue)
+    # Slots go straight into `output` (e.g. a ScheduleColumns) when given
+    runway_schedule = [] if output is None else output
+    total_planes = len(index)
     completed_planes = 0
 
     start_time = time.time()
 
-    while queue:
-        plane = queue.pop(0)
-        execute_time = min(plane['remaining_time'], time_quantum)
+    while completed_planes < total_planes:
+        admit(current_time)
+        if not queue:
+            # Runway idle, jump straight to the next arrival
+            current_time = arrivals.next_arrival()
+            continue
+
+        entry = queue.popleft()
+        plane = entry[0]
+        execute_time = min(entry[1], time_quantum)
         current_time += execute_time
-        plane['remaining_time'] -= execute_time
-
-        runway_schedule.append({
-            "plane_id": plane["id"],
-            "scheduled_at": current_time - execute_time,
-            "completed_at": current_time,
-            "type": plane["type"],
-            "priority": plane["priority"],
-            "runway_used": execute_time
-        })
-
-        if plane['remaining_time'] <= 0:
+        entry[1] -= execute_time
+
+        runway_schedule.append(Slot(
+            plane_id=plane.id,
+            scheduled_at=current_time - execute_time,
+            completed_at=current_time,
+            type=plane.type,
+            priority=plane.priority,
+            arrival_time=plane.arrival_time,
+            runway_used=execute_time
+        ))
+
+        if entry[1] <= 0:
             completed_planes += 1
             if progress_callback:
                 elapsed = round((time.time() - start_time) * 1000, 2)
                 progress_callback(completed_planes, elapsed)
         else:
-            queue.append(plane)
+            # Planes that arrived during this slice queue ahead of the preempted one
+            admit(current_time)
+            queue.append(entry)
 
     total_elapsed = round((time.time() - start_time) * 1000, 2)
     log_execution_time("Round Robin", total_elapsed)
 
     return runway_schedule, total_elapsed
 
-def run_rr_scheduler(progress_callback=None):
+def run_rr_scheduler(progress_callback=None, time_quantum=2, output=None):
     try:
         planes = read_planes_data("assets/planes.json")
         if not planes:
             raise ValueError("No plane data found.")
-        return round_robin_scheduler(planes, time_quantum=2, progress_callback=progress_callback)
+        return round_robin_scheduler(planes, time_quantum=time_quantum, progress_callback=progress_callback,
+                                     output=output)
     except Exception as e:
         print(f"[Round Robin Error] {str(e)}")
         return [], 0
\ No newline at end of file
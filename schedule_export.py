@@ -0,0 +1,79 @@
+import csv
+from itertools import islice
+from schedule_store import SCHEDULE_COLUMNS, ScheduleColumns
+
+CHUNK_SIZE = 50000
+
+
+def _iter_rows(schedule):
+    """Yield export rows from a ScheduleColumns or any iterable of Slots"""
+    if isinstance(schedule, ScheduleColumns):
+        yield from schedule.rows()
+        return
+    for slot in schedule:
+        yield (slot.plane_id, slot.scheduled_at, slot.type, slot.priority, slot.runway,
+               slot.completed_at, slot.runway_used)
+
+
+def _iter_chunks(schedule, chunk_size):
+    rows = _iter_rows(schedule)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def export_csv(schedule, path="results/schedule_output.csv", chunk_size=CHUNK_SIZE):
+    """Stream a schedule to CSV one chunk at a time, returns rows written"""
+    written = 0
+    with open(path, "w", newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(SCHEDULE_COLUMNS)
+        for chunk in _iter_chunks(schedule, chunk_size):
+            writer.writerows(chunk)
+            written += len(chunk)
+    return written
+
+
+def export_parquet(schedule, path="results/schedule_output.parquet", chunk_size=CHUNK_SIZE):
+    """Stream a schedule to Parquet one row group per chunk, returns rows written"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = pa.schema([
+        ("plane_id", pa.string()),
+        ("scheduled_at", pa.int64()),
+        ("type", pa.string()),
+        ("priority", pa.int8()),
+        ("runway", pa.string()),
+        ("completed_at", pa.int64()),
+        ("runway_used", pa.int64()),
+    ])
+
+    written = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in _iter_chunks(schedule, chunk_size):
+            columns = list(zip(*chunk))
+            batch = pa.record_batch([
+                pa.array(columns[0], pa.string()),
+                pa.array(columns[1], pa.int64()),
+                pa.array(columns[2], pa.string()),
+                pa.array(columns[3], pa.int8()),
+                pa.array(columns[4], pa.string()),
+                pa.array(columns[5], pa.int64()),
+                pa.array(columns[6], pa.int64()),
+            ], schema=schema)
+            writer.write_batch(batch)
+            written += len(chunk)
+    return written
+
+
+def export_schedule(schedule, path, chunk_size=CHUNK_SIZE):
+    """Pick the exporter from the file extension"""
+    if path.lower().endswith(".parquet"):
+        return export_parquet(schedule, path, chunk_size)
+    return export_csv(schedule, path, chunk_size)
@@ -0,0 +1,98 @@
+from array import array
+from models import Slot, intern_type
+
+SCHEDULE_COLUMNS = ("plane_id", "scheduled_at", "type", "priority", "runway", "completed_at", "runway_used")
+
+# Stored in place of None for the optional integer columns
+_UNSET = -1
+
+
+class ScheduleColumns:
+    """Column-oriented schedule backed by typed arrays.
+
+    Rows are only turned back into tuples when asked for, so a large
+    schedule costs a few bytes per slot instead of one object per slot.
+    Schedulers can append into it directly through their `output`
+    argument, so a full list of Slot objects never exists.
+    """
+
+    def __init__(self):
+        self.plane_id = []
+        self.scheduled_at = array("l")
+        self.type_code = array("B")
+        self.priority = array("B")
+        self.arrival_time = array("l")
+        self.runway_id = array("H")
+        self.completed_at = array("l")
+        self.runway_used = array("l")
+        self.types = []
+        self._type_codes = {}
+
+    @classmethod
+    def from_slots(cls, slots):
+        columns = cls()
+        columns.extend(slots)
+        return columns
+
+    def __len__(self):
+        return len(self.scheduled_at)
+
+    def _code_for(self, plane_type):
+        code = self._type_codes.get(plane_type)
+        if code is None:
+            code = self._type_codes[plane_type] = len(self.types)
+            self.types.append(intern_type(plane_type))
+        return code
+
+    def append(self, slot):
+        self.plane_id.append(slot.plane_id)
+        self.scheduled_at.append(slot.scheduled_at)
+        self.type_code.append(self._code_for(slot.type))
+        self.priority.append(slot.priority)
+        self.arrival_time.append(slot.arrival_time)
+        self.runway_id.append(slot.runway_id)
+        self.completed_at.append(_UNSET if slot.completed_at is None else slot.completed_at)
+        self.runway_used.append(_UNSET if slot.runway_used is None else slot.runway_used)
+
+    def extend(self, slots):
+        for slot in slots:
+            self.append(slot)
+
+    def __iter__(self):
+        """Yield each row as a short-lived Slot, e.g. for the metrics helpers"""
+        for i in range(len(self)):
+            yield self.slot(i)
+
+    def _optional(self, column, i):
+        value = column[i]
+        return None if value == _UNSET else value
+
+    def row(self, i):
+        """Return row i as a tuple matching SCHEDULE_COLUMNS, None for unset columns"""
+        return (
+            self.plane_id[i],
+            self.scheduled_at[i],
+            self.types[self.type_code[i]],
+            self.priority[i],
+            f"R{self.runway_id[i]}",
+            self._optional(self.completed_at, i),
+            self._optional(self.runway_used, i),
+        )
+
+    def rows(self, start=0, stop=None):
+        """Yield rows in [start, stop) without building the whole table"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for i in range(max(start, 0), stop):
+            yield self.row(i)
+
+    def slot(self, i):
+        return Slot(
+            plane_id=self.plane_id[i],
+            scheduled_at=self.scheduled_at[i],
+            type=self.types[self.type_code[i]],
+            priority=self.priority[i],
+            arrival_time=self.arrival_time[i],
+            runway_id=self.runway_id[i],
+            completed_at=self._optional(self.completed_at, i),
+            runway_used=self._optional(self.runway_used, i),
+        )
@@ -0,0 +1,84 @@
+import tkinter as tk
+from tkinter import ttk
+from schedule_store import SCHEDULE_COLUMNS
+
+
+class ScheduleViewer(tk.Frame):
+    """Virtualized schedule table.
+
+    The Treeview only ever holds `visible_rows` items; scrolling rewrites
+    their values from the array-backed schedule instead of inserting a
+    row per slot, so the widget stays the same size for any schedule.
+    """
+
+    def __init__(self, parent, visible_rows=15, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.visible_rows = visible_rows
+        self.schedule = None
+        self.first_row = 0
+
+        self.tree = ttk.Treeview(self, columns=SCHEDULE_COLUMNS, show="headings",
+                                 height=visible_rows, selectmode="none")
+        for col in SCHEDULE_COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=95, anchor="center")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.items = [self.tree.insert("", tk.END, values=()) for _ in range(visible_rows)]
+
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.first_row - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.first_row + 3))
+        self.refresh()
+
+    def set_schedule(self, schedule):
+        """Show a ScheduleColumns (or None to clear)"""
+        self.schedule = schedule
+        self.first_row = 0
+        self.refresh()
+
+    def total_rows(self):
+        return len(self.schedule) if self.schedule is not None else 0
+
+    def scroll_to(self, row):
+        max_first = max(self.total_rows() - self.visible_rows, 0)
+        self.first_row = min(max(int(row), 0), max_first)
+        self.refresh()
+
+    def on_scroll(self, action, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, units|pages)"""
+        if action == "moveto":
+            self.scroll_to(float(args[0]) * self.total_rows())
+        elif action == "scroll":
+            step = int(args[0])
+            if args[1] == "pages":
+                step *= self.visible_rows
+            self.scroll_to(self.first_row + step)
+
+    def on_mousewheel(self, event):
+        if not event.delta:
+            return "break"
+        # Windows reports multiples of 120 per notch, macOS small raw deltas
+        if self.tk.call("tk", "windowingsystem") == "win32":
+            step = max(abs(event.delta) // 120, 1)
+        else:
+            step = max(abs(event.delta), 1)
+        self.scroll_to(self.first_row - step if event.delta > 0 else self.first_row + step)
+        return "break"
+
+    def refresh(self):
+        """Materialize only the rows currently in view"""
+        total = self.total_rows()
+        rows = list(self.schedule.rows(self.first_row, self.first_row + self.visible_rows)) if total else []
+        for i, item in enumerate(self.items):
+            row = rows[i] if i < len(rows) else ()
+            self.tree.item(item, values=["" if value is None else value for value in row])
+
+        if total:
+            self.scrollbar.set(self.first_row / total,
+                               min(self.first_row + self.visible_rows, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
@@ -1,34 +1,43 @@
 import time
-import heapq
 from utils import read_planes_data, log_execution_time
+from models import Slot
+from arrival_index import ArrivalIndex
 
-def optimized_scheduler(plane_list, num_runways=1, progress_callback=None):
-    plane_list.sort(key=lambda x: (x["arrival_time"], x["priority"]))
-    heap = [(p["arrival_time"], p["priority"], p["id"], p) for p in plane_list]
-    heapq.heapify(heap)
+def optimized_scheduler(plane_list, num_runways=1, progress_callback=None, output=None, index=None):
+    if index is None:
+        index = ArrivalIndex.from_planes(plane_list)
+    arrivals = index.releaser()
 
     runways = [0] * num_runways  # Availability time for each runway
-    schedule = []
+    # Slots go straight into `output` (e.g. a ScheduleColumns) when given
+    schedule = [] if output is None else output
     current_time = 0
     start = time.time()
 
     count = 0
-    while heap:
-        _, priority, plane_id, plane = heapq.heappop(heap)
+    # Serve by (arrival, priority, id): the index already groups planes by
+    # arrival, so only each group of simultaneous arrivals needs sorting
+    batch = []
+    while batch or arrivals.next_arrival() is not None:
+        if not batch:
+            batch = sorted(arrivals.release(arrivals.next_arrival()),
+                           key=lambda p: (p.priority, p.id), reverse=True)
+        plane = batch.pop()
+        priority = plane.priority
 
         # Find the earliest available runway
         runway_id = min(range(num_runways), key=lambda r: runways[r])
-        scheduled_at = max(runways[runway_id], plane["arrival_time"])
+        scheduled_at = max(runways[runway_id], plane.arrival_time)
         runways[runway_id] = scheduled_at + 1
 
-        schedule.append({
-            "plane_id": plane["id"],
-            "scheduled_at": scheduled_at,
-            "type": plane["type"],
-            "priority": priority,
-            "arrival_time": plane["arrival_time"],
-            "runway_id": runway_id + 1  # 1-based for readability
-        })
+        schedule.append(Slot(
+            plane_id=plane.id,
+            scheduled_at=scheduled_at,
+            type=plane.type,
+            priority=priority,
+            arrival_time=plane.arrival_time,
+            runway_id=runway_id + 1  # 1-based for readability
+        ))
 
         count += 1
         if progress_callback:
@@ -41,11 +50,11 @@ def optimized_scheduler(plane_list, num_runways=1, progress_callback=None):
 
     return schedule, elapsed_total
 
-def run_and_time_scheduler(num_runways=1, progress_callback=None):
+def run_and_time_scheduler(num_runways=1, progress_callback=None, output=None):
     planes = read_planes_data("assets/planes.json")
     
     start_time = time.time()
-    schedule = optimized_scheduler(planes, num_runways, progress_callback)
+    schedule, _ = optimized_scheduler(planes, num_runways, progress_callback, output)
     end_time = time.time()
 
     elapsed_ms = round((end_time - start_time) * 1000, 2)
@@ -1,13 +1,20 @@
 import json
 import time
 from utils import read_planes_data, log_execution_time
+from models import Slot
+from arrival_index import ArrivalIndex
 
-def inefficient_scheduler(plane_list, num_runways=1, progress_callback=None):
-    runway_schedule = []
+def inefficient_scheduler(plane_list, num_runways=1, progress_callback=None, index=None, simulate_delay=True,
+                          output=None):
+    # Slots go straight into `output` (e.g. a ScheduleColumns) when given
+    runway_schedule = [] if output is None else output
     current_time = [0] * num_runways  # One clock per runway
     total_planes = len(plane_list)
+    if index is None:
+        index = ArrivalIndex.from_planes(plane_list)
+    start_time = time.time()
 
-    for i, plane in enumerate(sorted(plane_list, key=lambda x: x["arrival_time"])):
+    for i, plane in enumerate(index.in_arrival_order()):
         # Choose the earliest available runway
         selected_runway = current_time.index(min(current_time))
 
@@ -15,17 +22,19 @@ def inefficient_scheduler(plane_list, num_runways=1, progress_callback=None):
         for _ in range(current_time[selected_runway], current_time[selected_runway] + 5):
             pass
 
-        time.sleep(0.01)  # Simulate scheduling time
+        if simulate_delay:
+            time.sleep(0.01)  # Simulate scheduling time
 
-        scheduled_time = max(current_time[selected_runway], plane["arrival_time"])
+        scheduled_time = max(current_time[selected_runway], plane.arrival_time)
 
-        runway_schedule.append({
-            "plane_id": plane["id"],
-            "scheduled_at": scheduled_time,
-            "type": plane["type"],
-            "priority": plane["priority"],
-            "runway": f"R{selected_runway + 1}"
-        })
+        runway_schedule.append(Slot(
+            plane_id=plane.id,
+            scheduled_at=scheduled_time,
+            type=plane.type,
+            priority=plane.priority,
+            arrival_time=plane.arrival_time,
+            runway_id=selected_runway + 1
+        ))
 
         current_time[selected_runway] = scheduled_time + 1
 
@@ -34,20 +43,14 @@ def inefficient_scheduler(plane_list, num_runways=1, progress_callback=None):
             elapsed = (time.time() - start_time) * 1000  # Convert to ms
             progress_callback(i+1, elapsed)
 
-    return runway_schedule
+    elapsed = round((time.time() - start_time) * 1000, 2)  # in ms
+    log_execution_time("Original", elapsed)
+    return runway_schedule, elapsed
 
-def run_and_time_scheduler(num_runways=1, progress_callback=None):
-    global start_time
+def run_and_time_scheduler(num_runways=1, progress_callback=None, output=None):
     planes = read_planes_data("assets/planes.json")
-    start_time = time.time()
-
-    schedule = inefficient_scheduler(planes, num_runways, progress_callback)
-    end_time = time.time()
-
-    elapsed = round((end_time - start_time) * 1000, 2)  # in ms
+    schedule, elapsed = inefficient_scheduler(planes, num_runways, progress_callback, output=output)
     print(f"Inefficient scheduler took: {elapsed} ms")
-
-    log_execution_time("Original", elapsed)
     return schedule, elapsed
 
 if __name__ == "__main__":
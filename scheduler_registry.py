@@ -0,0 +1,89 @@
+import importlib
+from dataclasses import dataclass
+from utils import read_planes_data
+from arrival_index import ArrivalIndex
+
+
+@dataclass(frozen=True, slots=True)
+class SchedulerSpec:
+    """Where an algorithm lives and which run options it understands.
+
+    `function` is the in-memory scheduler, called as function(planes, ...).
+    The option flags say which optional keyword arguments it accepts, so
+    callers never have to inspect signatures. The capability flags
+    describe the schedule it produces: `preemptive` schedulers split a
+    plane over several slots, `streaming` ones append into `output` as
+    they go instead of returning a list to copy.
+    """
+    name: str
+    module: str
+    function: str
+    color: str
+    runways: bool = False         # num_runways
+    quantum: bool = False         # time_quantum
+    index: bool = False           # index (a shared ArrivalIndex)
+    simulate_delay: bool = False  # simulate_delay (artificial UI sleeps)
+    time_budget: bool = False     # time_budget (seconds)
+    preemptive: bool = False
+    streaming: bool = False       # output
+
+    def load(self):
+        """Import the module on first use and return its scheduler function"""
+        return getattr(importlib.import_module(self.module), self.function)
+
+    def run(self, planes, num_runways=1, quantum=2, progress_callback=None, output=None,
+            index=None, simulate_delay=True, time_budget=None):
+        """Schedule `planes`, returns (schedule, elapsed_ms)"""
+        kwargs = {"progress_callback": progress_callback}
+        if self.streaming:
+            kwargs["output"] = output
+        if self.runways:
+            kwargs["num_runways"] = num_runways
+        if self.quantum:
+            kwargs["time_quantum"] = quantum
+        if self.index and index is not None:
+            kwargs["index"] = index
+        if self.simulate_delay:
+            kwargs["simulate_delay"] = simulate_delay
+        if self.time_budget and time_budget is not None:
+            kwargs["time_budget"] = time_budget
+        schedule, elapsed = self.load()(planes, **kwargs)
+        if output is not None and schedule is not output:
+            output.extend(schedule)
+            schedule = output
+        return schedule, elapsed
+
+
+SCHEDULERS = {spec.name: spec for spec in (
+    SchedulerSpec("FCFS", "scheduler_original", "inefficient_scheduler", "#FF5722",
+                  runways=True, index=True, simulate_delay=True, streaming=True),
+    SchedulerSpec("Optimized", "scheduler_optimized", "optimized_scheduler", "#4CAF50",
+                  runways=True, index=True, streaming=True),
+    SchedulerSpec("EDF", "edf_scheduler", "edf_scheduler", "#2196F3",
+                  index=True, simulate_delay=True, streaming=True),
+    SchedulerSpec("Round Robin", "round_robin_scheduler", "round_robin_scheduler", "#9C27B0",
+                  quantum=True, index=True, preemptive=True, streaming=True),
+    SchedulerSpec("Priority Preemptive", "priority_preemptive_scheduler", "priority_preemptive_scheduler",
+                  "#FFC107", index=True, simulate_delay=True, preemptive=True, streaming=True),
+    SchedulerSpec("Solver", "solver_scheduler", "solver_scheduler", "#00BCD4",
+                  runways=True, index=True, time_budget=True, streaming=True),
+)}
+
+SCHEDULER_NAMES = list(SCHEDULERS)
+
+
+def get_scheduler(name):
+    try:
+        return SCHEDULERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown scheduler {name!r}, expected one of {SCHEDULER_NAMES}")
+
+
+def load_dataset(path="assets/planes.json"):
+    """File entry point for the GUI: read planes once and build the shared index"""
+    planes = read_planes_data(path)
+    return planes, ArrivalIndex.from_planes(planes)
+
+
+def run_scheduler(name, planes, **kwargs):
+    return get_scheduler(name).run(planes, **kwargs)
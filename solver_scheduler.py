@@ -0,0 +1,226 @@
+import time
+import heapq
+from utils import read_planes_data, log_execution_time
+from models import Slot
+from arrival_index import ArrivalIndex
+
+# Lower priority number = more important = costlier to delay
+PRIORITY_WEIGHTS = {1: 3, 2: 2, 3: 1}
+
+# A deadline miss must outweigh any delay change a single swap can cause
+MISS_PENALTY = 10 ** 6
+
+OBJECTIVES = ("weighted_delay", "deadline_misses")
+
+
+def _weight(plane):
+    return PRIORITY_WEIGHTS.get(plane.priority, 1)
+
+
+def _cost(plane, t, objective):
+    delay_cost = _weight(plane) * (t - plane.arrival_time)
+    if objective == "deadline_misses" and t > plane.deadline:
+        return MISS_PENALTY + delay_cost
+    return delay_cost
+
+
+def _total_cost(planes, times, objective):
+    return sum(_cost(p, t, objective) for p, t in zip(planes, times))
+
+
+def _greedy_times(planes, num_runways):
+    """Same rule as optimized_scheduler: serve by (arrival, priority) on the first free runway"""
+    order = sorted(range(len(planes)), key=lambda i: (planes[i].arrival_time, planes[i].priority))
+    runways = [0] * num_runways
+    times = [0] * len(planes)
+    for i in order:
+        free_at = heapq.heappop(runways)
+        times[i] = max(free_at, planes[i].arrival_time)
+        heapq.heappush(runways, times[i] + 1)
+    return times
+
+
+def _dispatch_times(planes, num_runways, objective, index):
+    """Fill every time step with the best planes that have arrived.
+
+    For weighted delay this serves the heaviest waiting planes first, which
+    is optimal for unit service times. For deadline misses it serves the
+    earliest deadline that can still be met and only then planes already late.
+    `index` must be built over `planes` in the same order; its row numbers
+    are positions in `planes`.
+    """
+    times = [0] * len(planes)
+    ready = []
+    late = []
+    arrivals = index.releaser()
+    current_time = 0
+    served = 0
+    released = 0
+
+    while served < len(planes):
+        for row in arrivals.release_rows(current_time):
+            plane = planes[row]
+            if objective == "deadline_misses":
+                key = (plane.deadline, -_weight(plane), released)
+            else:
+                key = (-_weight(plane), plane.arrival_time, released)
+            heapq.heappush(ready, (key, row))
+            released += 1
+
+        if not ready and not late:
+            current_time = arrivals.next_arrival()
+            continue
+
+        capacity = num_runways
+        while capacity and ready:
+            key, row = heapq.heappop(ready)
+            if objective == "deadline_misses" and planes[row].deadline < current_time:
+                # Already missed, let planes that can still make it go first
+                heapq.heappush(late, ((-_weight(planes[row]), key[2]), row))
+                continue
+            times[row] = current_time
+            capacity -= 1
+            served += 1
+        while capacity and late:
+            _, row = heapq.heappop(late)
+            times[row] = current_time
+            capacity -= 1
+            served += 1
+
+        current_time += 1
+
+    return times
+
+
+def _reported_cost(planes, times, objective):
+    """Weighted delay, or (deadline misses, weighted delay) for the miss objective"""
+    weighted_delay = _total_cost(planes, times, "weighted_delay")
+    if objective == "deadline_misses":
+        return sum(1 for p, t in zip(planes, times) if t > p.deadline), weighted_delay
+    return weighted_delay
+
+
+def _improve_by_swaps(planes, times, objective, deadline_at, window, on_window=None):
+    """One rolling-horizon pass of pairwise slot swaps, returns the cost gained.
+
+    Swapping two planes keeps the per-time runway counts, so only the
+    arrival constraint of the plane moving earlier has to be checked.
+    on_window(planes_covered) is called after each window.
+    """
+    order = sorted(range(len(planes)), key=times.__getitem__)
+    gained = 0
+    step = max(window // 2, 1)
+
+    for start in range(0, len(order), step):
+        if time.perf_counter() >= deadline_at:
+            break
+        end = min(start + window, len(order))
+        for a in range(start, end):
+            i = order[a]
+            for b in range(a + 1, end):
+                j = order[b]
+                ti, tj = times[i], times[j]
+                if ti == tj or planes[j].arrival_time > ti:
+                    continue
+                delta = (_cost(planes[i], tj, objective) + _cost(planes[j], ti, objective)
+                         - _cost(planes[i], ti, objective) - _cost(planes[j], tj, objective))
+                if delta < 0:
+                    times[i], times[j] = tj, ti
+                    order[a], order[b] = j, i
+                    i = j
+                    gained -= delta
+        if on_window:
+            on_window(end)
+
+    return gained
+
+
+def solver_scheduler(plane_list, num_runways=1, objective="weighted_delay", time_budget=2.0,
+                     window=64, progress_callback=None, on_improve=None, index=None, output=None):
+    """Near-optimal runway assignment for unit service times.
+
+    Seeds with the greedy optimized_scheduler rule, replaces it with a
+    dispatch schedule when that is cheaper, then runs rolling-horizon swap
+    passes until nothing improves or `time_budget` seconds are spent. The
+    current schedule is always feasible, and `on_improve(cost, elapsed_ms)`
+    is called each time it gets better. For weighted delay the cost equals
+    schedule_cost; for deadline misses it is a (misses, weighted delay) pair
+    whose first item equals schedule_cost, since the search also cuts delay
+    while the miss count holds.
+    progress_callback follows the first swap pass across the planes and
+    then keeps reporting all planes while later passes run.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}, expected one of {OBJECTIVES}")
+
+    start = time.time()
+    deadline_at = time.perf_counter() + time_budget
+    planes = list(plane_list)
+    if index is None:
+        index = ArrivalIndex.from_planes(planes)
+    elif len(index) != len(planes):
+        raise ValueError(f"index covers {len(index)} planes, plane_list has {len(planes)}")
+
+    def report(times):
+        if on_improve:
+            on_improve(_reported_cost(planes, times, objective), round((time.time() - start) * 1000, 2))
+
+    def progress(count):
+        if progress_callback:
+            progress_callback(count, round((time.time() - start) * 1000, 2))
+
+    times = _greedy_times(planes, num_runways)
+    best_cost = _total_cost(planes, times, objective)
+    report(times)
+
+    dispatch = _dispatch_times(planes, num_runways, objective, index)
+    dispatch_cost = _total_cost(planes, dispatch, objective)
+    if dispatch_cost < best_cost:
+        times, best_cost = dispatch, dispatch_cost
+        report(times)
+
+    passes = 0
+    while time.perf_counter() < deadline_at:
+        on_window = progress if passes == 0 else lambda covered: progress(len(planes))
+        gained = _improve_by_swaps(planes, times, objective, deadline_at, window, on_window)
+        passes += 1
+        if not gained:
+            break
+        best_cost -= gained
+        report(times)
+
+    # Number the runways within each time step
+    schedule = [] if output is None else output
+    used = {}
+    for i in sorted(range(len(planes)), key=lambda i: (times[i], planes[i].priority)):
+        plane = planes[i]
+        runway_id = used.get(times[i], 0) + 1
+        used[times[i]] = runway_id
+        schedule.append(Slot(
+            plane_id=plane.id,
+            scheduled_at=times[i],
+            type=plane.type,
+            priority=plane.priority,
+            arrival_time=plane.arrival_time,
+            runway_id=runway_id
+        ))
+    progress(len(planes))
+
+    elapsed_total = round((time.time() - start) * 1000, 2)
+    log_execution_time("Solver", elapsed_total)
+    return schedule, elapsed_total
+
+
+def schedule_cost(plane_list, schedule, objective="weighted_delay"):
+    """Total weighted delay, or number of deadline misses, of a schedule"""
+    planes = {p.id: p for p in plane_list}
+    if objective == "deadline_misses":
+        return sum(1 for slot in schedule if slot.scheduled_at > planes[slot.plane_id].deadline)
+    return sum(_cost(planes[slot.plane_id], slot.scheduled_at, objective) for slot in schedule)
+
+
+def run_solver_scheduler(num_runways=1, progress_callback=None, objective="weighted_delay", time_budget=2.0,
+                         output=None):
+    planes = read_planes_data("assets/planes.json")
+    return solver_scheduler(planes, num_runways, objective, time_budget, progress_callback=progress_callback,
+                            output=output)
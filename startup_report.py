@@ -0,0 +1,110 @@
+import argparse
+import subprocess
+import sys
+import time
+
+BUDGET_MS = 200
+
+# Builds the app window the same way main.py does and prints how long it took
+GUI_STARTUP = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+import main
+root = tk.Tk()
+app = main.AirportSchedulerApp(root)
+root.update()
+print((time.perf_counter() - start) * 1000)
+root.destroy()
+"""
+
+
+def _last_line(stderr):
+    lines = stderr.strip().splitlines()
+    return lines[-1] if lines else "no error output"
+
+
+def profile_imports(module):
+    """Import `module` in a fresh interpreter under -X importtime.
+
+    Returns (wall_ms, rows) where rows are (self_us, cumulative_us, name)
+    for every module the import pulled in.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed: {_last_line(result.stderr)}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return wall_ms, rows
+
+
+def profile_gui_startup():
+    """Time to import the app and draw its first main window.
+
+    Returns (wall_ms, in_process_ms), or raises RuntimeError when no window
+    can be created, e.g. without a display.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", GUI_STARTUP], capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(_last_line(result.stderr))
+    return wall_ms, float(result.stdout.strip().splitlines()[-1])
+
+
+def print_report(module, wall_ms, rows, top=15):
+    # Top-level imports have no indentation after the "|" separator
+    roots = [r for r in rows if not r[2].startswith("  ")]
+    import_ms = sum(r[1] for r in roots) / 1000
+
+    print(f"== {module}: {import_ms:.1f} ms importing, {wall_ms:.1f} ms process wall time")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>14.2f} {self_us / 1000:>9.2f}  {name}")
+    return import_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time report for the app entry points")
+    parser.add_argument("modules", nargs="*", default=["main", "sweep"])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help="exit non-zero if any import or the GUI window takes longer than this")
+    parser.add_argument("--no-gui", action="store_true", help="skip timing the Tk window creation")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        wall_ms, rows = profile_imports(module)
+        import_ms = print_report(module, wall_ms, rows, args.top)
+        if import_ms > args.budget_ms:
+            over_budget.append(module)
+        print()
+
+    if not args.no_gui:
+        try:
+            wall_ms, window_ms = profile_gui_startup()
+            print(f"== GUI: window drawn {window_ms:.1f} ms after import start, "
+                  f"{wall_ms:.1f} ms process wall time")
+            if window_ms > args.budget_ms:
+                over_budget.append("GUI window")
+        except RuntimeError as e:
+            print(f"== GUI: not measured ({e})")
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
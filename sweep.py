@@ -0,0 +1,193 @@
+import argparse
+import csv
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import utils
+import metrics
+from models import Plane, intern_type
+from arrival_index import ArrivalIndex
+from schedule_store import ScheduleColumns
+from generate_planes import make_planes
+from scheduler_registry import SCHEDULER_NAMES, get_scheduler
+
+SWEEP_COLUMNS = ("planes", "seed", "algorithm", "preemptive", "runways", "quantum",
+                 "avg_delay", "p95_delay", "makespan", "elapsed_ms", "target_met")
+
+# Worker-side cache of datasets rebuilt from shared memory, by dataset key
+_DATASETS = {}
+
+# Fixed-width columns placed in shared memory, with their array typecodes
+_SHARED_COLUMNS = {"arrival_time": "q", "deadline": "q", "priority": "B", "type_code": "B", "order": "q"}
+
+
+def share_dataset(num_planes, seed):
+    """Generate one dataset and copy its columns into shared memory.
+
+    The stable arrival order is computed here once, so no worker sorts it
+    again. Returns (meta, blocks): meta is the small picklable description a
+    worker needs to attach, blocks are the SharedMemory objects to unlink.
+    """
+    columns = utils.planes_to_columns(make_planes(num_planes, seed))
+    types = sorted(set(columns["type"]))
+    codes = {t: i for i, t in enumerate(types)}
+    arrays = {
+        "arrival_time": array("q", columns["arrival_time"]),
+        "deadline": array("q", columns["deadline"]),
+        "priority": array("B", columns["priority"]),
+        "type_code": array("B", (codes[t] for t in columns["type"])),
+        "order": array("q", sorted(range(num_planes), key=columns["arrival_time"].__getitem__)),
+    }
+    id_blob = "\n".join(columns["id"]).encode()
+
+    blocks = {}
+    for name, values in list(arrays.items()) + [("id", id_blob)]:
+        data = values.tobytes() if name != "id" else values
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        block.buf[:len(data)] = data
+        blocks[name] = (block, len(data))
+
+    meta = {"n": num_planes, "types": types,
+            "blocks": {name: (block.name, size) for name, (block, size) in blocks.items()}}
+    return meta, [block for block, _ in blocks.values()]
+
+
+def _attach_dataset(meta):
+    """Rebuild planes and their index in this worker from the shared columns"""
+    raw = {}
+    for name, (block_name, size) in meta["blocks"].items():
+        block = shared_memory.SharedMemory(name=block_name)
+        raw[name] = bytes(block.buf[:size])
+        block.close()
+
+    columns = {}
+    for name, typecode in _SHARED_COLUMNS.items():
+        columns[name] = array(typecode)
+        columns[name].frombytes(raw[name])
+    columns["id"] = raw["id"].decode().split("\n") if meta["n"] else []
+    types = [intern_type(t) for t in meta["types"]]
+
+    planes = [Plane(plane_id, types[code], priority, arrival, deadline)
+              for plane_id, code, priority, arrival, deadline in
+              zip(columns["id"], columns["type_code"], columns["priority"],
+                  columns["arrival_time"], columns["deadline"])]
+    index = ArrivalIndex.from_columns(columns, items=planes, order=columns["order"])
+    return planes, index
+
+
+def _init_worker():
+    utils.LOG_EXECUTION_TIMES = False
+
+
+def _evaluate(dataset_key, meta, algorithm, runway_counts, quantum, target_p95, solver_budget):
+    """Run one algorithm over increasing runway counts, stopping at the target"""
+    if dataset_key not in _DATASETS:
+        _DATASETS[dataset_key] = _attach_dataset(meta)
+    planes, index = _DATASETS[dataset_key]
+    spec = get_scheduler(algorithm)
+    rows = []
+
+    for runways in runway_counts:
+        start = time.perf_counter()
+        # Streaming schedulers fill the compact column store directly
+        schedule, _ = spec.run(planes, num_runways=runways, quantum=quantum, index=index,
+                               simulate_delay=False, time_budget=solver_budget,
+                               output=ScheduleColumns() if spec.streaming else None)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        # Delays are per plane, so preemptive slices do not count several times
+        p95 = metrics.percentile_delay(schedule, 95, index, per_plane=True)
+        target_met = target_p95 is not None and p95 <= target_p95
+        rows.append((dataset_key[0], dataset_key[1], algorithm, spec.preemptive, runways, quantum,
+                     round(metrics.calculate_avg_delay(schedule, index, per_plane=True), 2), p95,
+                     metrics.makespan(schedule), elapsed_ms, target_met))
+
+        # More runways can only help, so the rest of this line is pruned
+        if target_met:
+            break
+
+    return rows
+
+
+def plan_grid(plane_counts, runway_counts, quanta, algorithms, seed):
+    """Yield one task per (dataset, algorithm, quantum) covering all runway counts.
+
+    Parameters an algorithm ignores collapse to a single value so the same
+    schedule is not computed once per meaningless combination.
+    """
+    runway_counts = sorted(runway_counts)
+    for num_planes in plane_counts:
+        for algorithm in algorithms:
+            spec = get_scheduler(algorithm)
+            for quantum in (quanta if spec.quantum else [None]):
+                yield ((num_planes, seed), algorithm,
+                       runway_counts if spec.runways else [1], quantum)
+
+
+def run_sweep(plane_counts, runway_counts, quanta, algorithms, out_path="results/sweep_results.csv",
+              seed=0, target_p95=None, workers=None, solver_budget=1.0, on_row=None):
+    """Evaluate the grid in parallel and stream every result row into one CSV.
+
+    Each dataset is generated once and its columns live in shared memory;
+    a worker only rebuilds the datasets its own tasks ask for.
+    """
+    shared = {}
+    blocks = []
+    written = 0
+
+    try:
+        for n in plane_counts:
+            shared[(n, seed)], dataset_blocks = share_dataset(n, seed)
+            blocks.extend(dataset_blocks)
+
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        with open(out_path, "w", newline='') as csvfile, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            writer = csv.writer(csvfile)
+            writer.writerow(SWEEP_COLUMNS)
+
+            futures = [pool.submit(_evaluate, key, shared[key], algorithm, runways, quantum,
+                                   target_p95, solver_budget)
+                       for key, algorithm, runways, quantum in
+                       plan_grid(plane_counts, runway_counts, quanta, algorithms, seed)]
+
+            for future in as_completed(futures):
+                for row in future.result():
+                    writer.writerow(row)
+                    written += 1
+                    if on_row:
+                        on_row(row)
+                csvfile.flush()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep planes x runways x quantum x algorithm")
+    parser.add_argument("--planes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--runways", type=int, nargs="+", default=[1, 2, 3, 4, 5])
+    parser.add_argument("--quantum", type=int, nargs="+", default=[2])
+    parser.add_argument("--algorithms", nargs="+", default=SCHEDULER_NAMES, choices=SCHEDULER_NAMES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target-p95", type=float, default=None,
+                        help="stop adding runways once p95 delay is at or below this")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--solver-budget", type=float, default=1.0, help="seconds per solver run")
+    parser.add_argument("--out", default="results/sweep_results.csv")
+    args = parser.parse_args()
+
+    start = time.time()
+    rows = run_sweep(args.planes, args.runways, args.quantum, args.algorithms, args.out,
+                     seed=args.seed, target_p95=args.target_p95, workers=args.workers,
+                     solver_budget=args.solver_budget)
+    print(f"Wrote {rows} rows to {args.out} in {time.time() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
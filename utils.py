@@ -1,12 +1,34 @@
  
 import json
 import csv
+from array import array
+from models import Plane, intern_type
 
 def read_planes_data(path):
     with open(path, "r") as f:
-        return json.load(f)
+        return [Plane.from_dict(p) for p in json.load(f)]
+
+def read_planes_columns(path):
+    """Load planes as one array/list per field instead of one record per plane"""
+    with open(path, "r") as f:
+        return planes_to_columns(json.load(f))
+
+def planes_to_columns(planes):
+    """Turn plane dicts into the column layout used by read_planes_columns"""
+    return {
+        "id": [p["id"] for p in planes],
+        "type": [intern_type(p["type"]) for p in planes],
+        "priority": array("B", (p["priority"] for p in planes)),
+        "arrival_time": array("l", (p["arrival_time"] for p in planes)),
+        "deadline": array("l", (p["deadline"] for p in planes)),
+    }
+
+# Sweeps run thousands of schedules and turn this off in their workers
+LOG_EXECUTION_TIMES = True
 
 def log_execution_time(label, ms):
+    if not LOG_EXECUTION_TIMES:
+        return
     with open("results/execution_times.csv", "a", newline='') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Test", label, ms])